@@ -16,8 +16,6 @@
 This module provides the implementation of AutoGraph primitives in terms of traceable PennyLane
 functions. The purpose is to convert imperative style code to functional or graph-style code.
 """
-import copy
-import functools
 from typing import Any, Callable, Iterator, SupportsIndex, Tuple, Union
 
 from malt.core import config as ag_config
@@ -57,9 +55,12 @@ def _assert_results(results, var_names):
 
     assert len(results) == len(var_names)
 
-    for r, v in zip(results, var_names):
-        if isinstance(r, Undefined):
-            raise AutoGraphError(f"Some branches did not define a value for variable '{v}'")
+    # fast scan for the common case of no undefined results; only zip with the
+    # variable names on the error path
+    if any(isinstance(r, Undefined) for r in results):
+        for r, v in zip(results, var_names):
+            if isinstance(r, Undefined):
+                raise AutoGraphError(f"Some branches did not define a value for variable '{v}'")
 
     return results
 
@@ -77,25 +78,30 @@ def if_stmt(
     """An implementation of the AutoGraph 'if' statement. The interface is defined by AutoGraph,
     here we merely provide an implementation of it in terms of PennyLane primitives."""
 
+    # Importing CondCallable at the top of the file creates circular imports
+    # pylint: disable=import-outside-toplevel
+    from pennylane.ops.op_math.condition import CondCallable
+
     # Cache the initial state of all modified variables. Required because we trace all branches,
     # and want to restore the initial state before entering each branch.
     init_state = get_state()
 
-    @qml.cond(pred)
-    def functional_cond():
+    def true_branch():
         set_state(init_state)
         true_fn()
         results = get_state()
         return _assert_results(results, symbol_names)
 
-    @functional_cond.otherwise
-    def functional_cond():
+    def false_branch():
         set_state(init_state)
         false_fn()
         results = get_state()
         return _assert_results(results, symbol_names)
 
-    results = functional_cond()
+    # Build the conditional directly instead of going through the qml.cond
+    # decorator sugar, which would add a compiler-dispatch check plus two
+    # decorator applications on every traced `if`.
+    results = CondCallable(pred, true_branch, false_branch)()
     set_state(results)
 
 
@@ -328,13 +334,27 @@ def while_stmt(loop_test, loop_body, get_state, set_state, symbol_names, _opts):
 # Prevent autograph from converting PennyLane and Catalyst library code, this can lead to many
 # issues such as always tracing through code that should only be executed conditionally. We might
 # have to be even more restrictive in the future to prevent issues if necessary.
-module_allowlist = (
-    ag_config.DoNotConvert("pennylane"),
-    ag_config.DoNotConvert("catalyst"),
-    ag_config.DoNotConvert("optax"),
-    ag_config.DoNotConvert("jax"),
-    *ag_config.CONVERSION_RULES,
-)
+_module_allowlist = None
+
+
+def _get_module_allowlist():
+    """Return the conversion rules for autograph, built lazily on first use.
+
+    The PennyLane-specific ``DoNotConvert`` rules are placed before autograph's own
+    rules since most user code hits them, letting the rule scan short-circuit early.
+    Building the tuple lazily also avoids copying autograph's conversion rules at
+    import time.
+    """
+    global _module_allowlist  # pylint: disable=global-statement
+    if _module_allowlist is None:
+        _module_allowlist = (
+            ag_config.DoNotConvert("pennylane"),
+            ag_config.DoNotConvert("catalyst"),
+            ag_config.DoNotConvert("optax"),
+            ag_config.DoNotConvert("jax"),
+            *ag_config.CONVERSION_RULES,
+        )
+    return _module_allowlist
 
 
 class Patcher:
@@ -362,6 +382,60 @@ class Patcher:
             setattr(obj, attr_name, self.backup[(obj, attr_name)])
 
 
+_patched = False
+_patch_backup = {}
+
+
+def _ensure_patched():
+    """Install the AutoGraph patches once and leave them in place.
+
+    The patched values never change between calls, so paying a ``Patcher`` context
+    manager on every ``converted_call`` is unnecessary overhead. Callers that need
+    to undo the patches (e.g. tests) can use :func:`_restore_patches`.
+    """
+    global _patched  # pylint: disable=global-statement
+    if _patched:
+        return
+
+    # Build the allowlist before overwriting CONVERSION_RULES, since it extends them.
+    allowlist = _get_module_allowlist()
+
+    # pylint: disable=protected-access
+    _patch_backup["_TRANSPILER"] = ag_api._TRANSPILER
+    _patch_backup["CONVERSION_RULES"] = ag_config.CONVERSION_RULES
+    _patch_backup["BUILTIN_FUNCTIONS_MAP"] = ag_py_builtins.BUILTIN_FUNCTIONS_MAP
+
+    ag_api._TRANSPILER = qml.capture.autograph.transformer.TRANSFORMER
+    ag_config.CONVERSION_RULES = allowlist
+    ag_py_builtins.BUILTIN_FUNCTIONS_MAP = py_builtins_map
+    _patched = True
+
+
+def _restore_patches():
+    """Undo the patches installed by :func:`_ensure_patched`."""
+    global _patched  # pylint: disable=global-statement
+    if not _patched:
+        return
+
+    # pylint: disable=protected-access
+    ag_api._TRANSPILER = _patch_backup.pop("_TRANSPILER")
+    ag_config.CONVERSION_RULES = _patch_backup.pop("CONVERSION_RULES")
+    ag_py_builtins.BUILTIN_FUNCTIONS_MAP = _patch_backup.pop("BUILTIN_FUNCTIONS_MAP")
+    _patched = False
+
+
+def _shallow_clone_qnode(qnode):
+    """Create a throwaway shallow clone of a QNode.
+
+    Unlike ``copy.copy``, this only copies the instance ``__dict__`` without
+    duplicating the transform program or keyword-argument dicts, which is all
+    that is needed for a clone that is called once and discarded.
+    """
+    clone = qnode.__class__.__new__(qnode.__class__)
+    clone.__dict__ = qnode.__dict__.copy()
+    return clone
+
+
 def converted_call(fn, args, kwargs, caller_fn_scope=None, options=None):
     """A wrapper for the autograph ``converted_call`` function, imported here as
     ``ag_converted_call``. It returns the result of executing a possibly-converted
@@ -379,53 +453,48 @@ def converted_call(fn, args, kwargs, caller_fn_scope=None, options=None):
     """
 
     # TODO: eliminate the need for patching by improving the autograph interface
-    with Patcher(
-        (ag_api, "_TRANSPILER", qml.capture.autograph.transformer.TRANSFORMER),
-        (ag_config, "CONVERSION_RULES", module_allowlist),
-        (ag_py_builtins, "BUILTIN_FUNCTIONS_MAP", py_builtins_map),
+    _ensure_patched()
+
+    # Using qml.ops.op_math.adjoint points to the adjoint function
+    # and importing this at the top of the file creates circular imports
+    # pylint: disable=import-outside-toplevel, protected-access
+    from pennylane.ops.op_math.adjoint import _capture_adjoint_transform
+
+    # HOTFIX: pass through calls of known PennyLane wrapper functions
+    if fn in (
+        _capture_adjoint_transform,
+        qml.ops.op_math.controlled._capture_ctrl_transform,
+        qml.grad,
+        qml.jacobian,
+        qml.vjp,
+        qml.jvp,
     ):
-        # Using qml.ops.op_math.adjoint points to the adjoint function
-        # and importing this at the top of the file creates circular imports
-        # pylint: disable=import-outside-toplevel, protected-access
-        from pennylane.ops.op_math.adjoint import _capture_adjoint_transform
-
-        # HOTFIX: pass through calls of known PennyLane wrapper functions
-        if fn in (
-            _capture_adjoint_transform,
-            qml.ops.op_math.controlled._capture_ctrl_transform,
-            qml.grad,
-            qml.jacobian,
-            qml.vjp,
-            qml.jvp,
-        ):
-            assert args and callable(args[0])
-            wrapped_fn = args[0]
-
-            @functools.wraps(wrapped_fn)
-            def passthrough_wrapper(*inner_args, **inner_kwargs):
-                return converted_call(
-                    wrapped_fn, inner_args, inner_kwargs, caller_fn_scope, options
-                )
-
-            return fn(
-                passthrough_wrapper,
-                *args[1:],
-                **(kwargs if kwargs is not None else {}),
-            )
+        assert args and callable(args[0])
+        wrapped_fn = args[0]
+
+        # the wrapper is consumed immediately and never introspected, so there is
+        # no need to pay for functools.wraps here
+        def passthrough_wrapper(*inner_args, **inner_kwargs):
+            return converted_call(wrapped_fn, inner_args, inner_kwargs, caller_fn_scope, options)
+
+        return fn(
+            passthrough_wrapper,
+            *args[1:],
+            **(kwargs if kwargs is not None else {}),
+        )
 
-        # For QNode calls, we employ a wrapper to forward the quantum function call to autograph
-        if isinstance(fn, qml.QNode):
+    # For QNode calls, we employ a wrapper to forward the quantum function call to autograph
+    if isinstance(fn, qml.QNode):
 
-            @functools.wraps(fn.func)
-            def qnode_call_wrapper():
-                return ag_converted_call(fn.func, args, kwargs, caller_fn_scope, options)
+        def qnode_call_wrapper():
+            return ag_converted_call(fn.func, args, kwargs, caller_fn_scope, options)
 
-            # Copy the original qnode but replace its function.
-            new_qnode = copy.copy(fn)
-            new_qnode.func = qnode_call_wrapper
-            return new_qnode()
+        # Shallow-clone the original qnode but replace its function.
+        new_qnode = _shallow_clone_qnode(fn)
+        new_qnode.func = qnode_call_wrapper
+        return new_qnode()
 
-        return ag_converted_call(fn, args, kwargs, caller_fn_scope, options)
+    return ag_converted_call(fn, args, kwargs, caller_fn_scope, options)
 
 
 class PRange:
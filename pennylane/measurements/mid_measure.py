@@ -14,16 +14,22 @@
 """
 This module contains the qml.measure measurement.
 """
-import uuid
+import itertools
 from collections.abc import Hashable
 from functools import lru_cache
 from typing import Generic, Optional, TypeVar, Union
 
+import numpy as np
+
 import pennylane as qml
 from pennylane.wires import Wires
 
 from .measurements import MeasurementProcess
 
+# Monotonic counter used to generate mid-circuit measurement ids; these only need
+# to be unique within a process.
+_MCM_ID = itertools.count()
+
 
 def measure(wires: Union[Hashable, Wires], reset: bool = False, postselect: Optional[int] = None):
     r"""Perform a mid-circuit measurement in the computational basis on the
@@ -210,7 +216,7 @@ def measure(wires: Union[Hashable, Wires], reset: bool = False, postselect: Opti
 
     """
     if qml.capture.enabled():
-        primitive = _create_mid_measure_primitive()
+        primitive = _mid_measure_primitive or _create_mid_measure_primitive()
         return primitive.bind(wires, reset=reset, postselect=postselect)
 
     return _measure_impl(wires, reset=reset, postselect=postselect)
@@ -226,23 +232,35 @@ def _measure_impl(
             "Only a single qubit can be measured in the middle of the circuit"
         )
 
-    # Create a UUID and a map between MP and MV to support serialization
-    measurement_id = str(uuid.uuid4())
+    # Create a process-unique id and a map between MP and MV to support serialization.
+    # A monotonic counter is enough here, and avoids the os.urandom syscall and string
+    # formatting that a fresh UUID would incur for every measurement.
+    measurement_id = f"mcm_{next(_MCM_ID)}"
     mp = MidMeasureMP(wires=wires, reset=reset, postselect=postselect, id=measurement_id)
     return MeasurementValue([mp], processing_fn=lambda v: v)
 
 
-@lru_cache
+# Module-level singleton so that ``measure`` only pays an ``is None`` check per call
+# instead of an ``lru_cache`` lookup on the capture hot path.
+_mid_measure_primitive = None
+
+
 def _create_mid_measure_primitive():
     """Create a primitive corresponding to an mid-circuit measurement type.
 
-    Called when using :func:`~pennylane.measure`.
+    Called when using :func:`~pennylane.measure`. The primitive is built once and
+    stored in the module-level ``_mid_measure_primitive``; subsequent calls return
+    the cached instance.
 
     Returns:
         jax.core.Primitive: A new jax primitive corresponding to a mid-circuit
         measurement.
 
     """
+    global _mid_measure_primitive  # pylint: disable=global-statement
+    if _mid_measure_primitive is not None:
+        return _mid_measure_primitive
+
     # pylint: disable=import-outside-toplevel
     import jax
 
@@ -259,9 +277,44 @@ def _create_mid_measure_primitive():
         dtype = jax.numpy.int64 if jax.config.jax_enable_x64 else jax.numpy.int32
         return jax.core.ShapedArray((), dtype)
 
+    _mid_measure_primitive = mid_measure_p
     return mid_measure_p
 
 
+@lru_cache
+def _enumerate_branches(num_meas):
+    """Return all possible branches for ``num_meas`` measurements as a tuple of
+    tuples of ints, ordered by their integer value.
+
+    The branches are extracted by bit-twiddling rather than string formatting, and
+    the table is cached so repeated enumerations of the same number of measurements
+    amortize to tuple lookups.
+    """
+    shifts = range(num_meas - 1, -1, -1)
+    return tuple(tuple((i >> s) & 1 for s in shifts) for i in range(2**num_meas))
+
+
+class _ComposedProcessingFn:
+    """Composition of a base processing function with a chain of unary transforms.
+
+    Consecutive :meth:`MeasurementValue._apply` calls extend the transform tuple
+    instead of nesting closures, so evaluating a chain of K scalar operations
+    walks a flat loop rather than a K-deep Python call stack.
+    """
+
+    __slots__ = ("base_fn", "transforms")
+
+    def __init__(self, base_fn, transforms):
+        self.base_fn = base_fn
+        self.transforms = transforms
+
+    def __call__(self, *x):
+        out = self.base_fn(*x)
+        for fn in self.transforms:
+            out = fn(out)
+        return out
+
+
 T = TypeVar("T")
 
 
@@ -297,9 +350,11 @@ class MidMeasureMP(MeasurementProcess):
         id: Optional[str] = None,
     ):
         self.batch_size = None
-        super().__init__(wires=Wires(wires), id=id)
+        # _measure_impl already passes a Wires instance; avoid re-normalizing it
+        super().__init__(wires=wires if isinstance(wires, Wires) else Wires(wires), id=id)
         self.reset = reset
         self.postselect = postselect
+        self._hash = None
 
     # pylint: disable=arguments-renamed, arguments-differ
     @classmethod
@@ -347,16 +402,27 @@ class MidMeasureMP(MeasurementProcess):
     def _queue_category(self):
         return "_ops"
 
+    def map_wires(self, wire_map: dict):
+        new_measurement = super().map_wires(wire_map)
+        # the shallow copy carries over the cached hash, which depends on the wires
+        new_measurement._hash = None  # pylint: disable=protected-access
+        return new_measurement
+
     @property
     def hash(self):
         """int: Returns an integer hash uniquely representing the measurement process"""
-        fingerprint = (
-            self.__class__.__name__,
-            tuple(self.wires.tolist()),
-            self.id,
-        )
+        if self._hash is None:
+            # the measurement process is effectively immutable once constructed, so
+            # the fingerprint hash is computed once and cached; ``labels`` is the
+            # tuple already stored on the wires, avoiding a tolist() allocation
+            fingerprint = (
+                self.__class__.__name__,
+                self.wires.labels,
+                self.id,
+            )
+            self._hash = hash(fingerprint)
 
-        return hash(fingerprint)
+        return self._hash
 
     @property
     def data(self):
@@ -392,30 +458,29 @@ class MeasurementValue(Generic[T]):
 
     def items(self):
         """A generator representing all the possible outcomes of the MeasurementValue."""
-        num_meas = len(self.measurements)
-        for i in range(2**num_meas):
-            branch = tuple(int(b) for b in f"{i:0{num_meas}b}")
+        for branch in _enumerate_branches(len(self.measurements)):
             yield branch, self.processing_fn(*branch)
 
     def postselected_items(self):
         """A generator representing all the possible outcomes of the MeasurementValue,
         taking postselection into account."""
-        # pylint: disable=stop-iteration-return
+        # In the common case of no postselection every branch is kept as-is
+        if not any(m.postselect is not None for m in self.measurements):
+            yield from self.items()
+            return
+        num_meas = len(self.measurements)
         ps = {i: p for i, m in enumerate(self.measurements) if (p := m.postselect) is not None}
-        num_non_ps = len(self.measurements) - len(ps)
+        num_non_ps = num_meas - len(ps)
         if num_non_ps == 0:
             yield (), self.processing_fn(*ps.values())
             return
-        for i in range(2**num_non_ps):
-            # Create the branch ignoring postselected measurements
-            non_ps_branch = tuple(int(b) for b in f"{i:0{num_non_ps}b}")
-            # We want a consumable iterable and the static tuple above
-            non_ps_branch_iter = iter(non_ps_branch)
-            # Extend the branch to include postselected measurements
-            full_branch = tuple(
-                ps[j] if j in ps else next(non_ps_branch_iter)
-                for j in range(len(self.measurements))
-            )
+        # Template branch with the postselected values filled in; the remaining
+        # positions are assigned directly per branch instead of consuming an iterator
+        full_branch = [ps.get(j, 0) for j in range(num_meas)]
+        non_ps_positions = [j for j in range(num_meas) if j not in ps]
+        for non_ps_branch in _enumerate_branches(num_non_ps):
+            for position, value in zip(non_ps_positions, non_ps_branch):
+                full_branch[position] = value
             # Return the reduced non-postselected branch and the procesing function
             # evaluated on the full branch
             yield non_ps_branch, self.processing_fn(*full_branch)
@@ -429,12 +494,30 @@ class MeasurementValue(Generic[T]):
     def branches(self):
         """A dictionary representing all possible outcomes of the MeasurementValue."""
         ret_dict = {}
-        num_meas = len(self.measurements)
-        for i in range(2**num_meas):
-            branch = tuple(int(b) for b in f"{i:0{num_meas}b}")
+        for branch in _enumerate_branches(len(self.measurements)):
             ret_dict[branch] = self.processing_fn(*branch)
         return ret_dict
 
+    def branches_vectorized(self):
+        """Evaluate all possible outcomes of the MeasurementValue in a single
+        vectorized NumPy call.
+
+        The processing function is applied once to the columns of the full
+        ``(2**num_meas, num_meas)`` branch matrix instead of being invoked per
+        branch. This requires the processing function to be composed of
+        broadcasting (elementwise) operations, which holds for any function built
+        through the arithmetic and logical dunder methods.
+
+        Returns:
+            ndarray: array of length ``2**num_meas`` containing the processed
+            outcome of each branch, ordered by the integer value of the branch
+            bitstring.
+        """
+        num_meas = len(self.measurements)
+        indices = np.arange(2**num_meas, dtype=np.int64)
+        branch_matrix = (indices[:, None] >> np.arange(num_meas - 1, -1, -1)) & 1
+        return self.processing_fn(*(branch_matrix[:, j] for j in range(num_meas)))
+
     def map_wires(self, wire_map):
         """Returns a copy of the current ``MeasurementValue`` with the wires of each measurement changed
         according to the given wire map.
@@ -488,6 +571,16 @@ class MeasurementValue(Generic[T]):
         return self._transform_bin_op(lambda a, b: a * b, other)
 
     def __rmul__(self, other):
+        if isinstance(other, (int, float, complex)):
+            # Python numbers multiply directly; only fall back to the framework
+            # dispatch of cast_like when the branch value is a tensor.
+            return self._apply(
+                lambda v: (
+                    other * v
+                    if isinstance(v, (int, float, complex))
+                    else other * qml.math.cast_like(v, other)
+                )
+            )
         return self._apply(lambda v: other * qml.math.cast_like(v, other))
 
     def __truediv__(self, other):
@@ -522,7 +615,13 @@ class MeasurementValue(Generic[T]):
 
     def _apply(self, fn):
         """Apply a post computation to this measurement"""
-        return MeasurementValue(self.measurements, lambda *x: fn(self.processing_fn(*x)))
+        prev = self.processing_fn
+        if isinstance(prev, _ComposedProcessingFn):
+            # fuse with the existing chain instead of nesting another closure
+            composed = _ComposedProcessingFn(prev.base_fn, prev.transforms + (fn,))
+        else:
+            composed = _ComposedProcessingFn(prev, (fn,))
+        return MeasurementValue(self.measurements, composed)
 
     def concretize(self, measurements: dict):
         """Returns a concrete value from a dictionary of hashes with concrete values."""
@@ -533,36 +632,35 @@ class MeasurementValue(Generic[T]):
         """Merge two measurement values"""
 
         # create a new merged list with no duplicates and in lexical ordering
-        merged_measurements = list(set(self.measurements).union(set(other.measurements)))
+        merged_measurements = list(dict.fromkeys(self.measurements + other.measurements))
         merged_measurements.sort(key=lambda m: m.id)
 
+        # precompute the index of each sub-measurement in the merged list once,
+        # so the merged function only performs tuple lookups per call
+        positions = {m: i for i, m in enumerate(merged_measurements)}
+        indices_1 = tuple(positions[m] for m in self.measurements)
+        indices_2 = tuple(positions[m] for m in other.measurements)
+
         # create a new function that selects the correct indices for each sub function
         def merged_fn(*x):
-            sub_args_1 = (x[i] for i in [merged_measurements.index(m) for m in self.measurements])
-            sub_args_2 = (x[i] for i in [merged_measurements.index(m) for m in other.measurements])
-
-            out_1 = self.processing_fn(*sub_args_1)
-            out_2 = other.processing_fn(*sub_args_2)
+            out_1 = self.processing_fn(*(x[i] for i in indices_1))
+            out_2 = other.processing_fn(*(x[i] for i in indices_2))
 
             return out_1, out_2
 
         return MeasurementValue(merged_measurements, merged_fn)
 
     def __getitem__(self, i):
-        branch = tuple(int(b) for b in f"{i:0{len(self.measurements)}b}")
+        branch = _enumerate_branches(len(self.measurements))[i]
         return self.processing_fn(*branch)
 
     def __str__(self):
         lines = []
-        num_meas = len(self.measurements)
-        for i in range(2**num_meas):
-            branch = tuple(int(b) for b in f"{i:0{num_meas}b}")
-            id_branch_mapping = [
-                f"{self.measurements[j].id}={branch[j]}" for j in range(len(branch))
-            ]
-            lines.append(
-                "if " + ",".join(id_branch_mapping) + " => " + str(self.processing_fn(*branch))
-            )
+        ids = [m.id for m in self.measurements]
+        num_meas = len(ids)
+        for branch in _enumerate_branches(num_meas):
+            id_branch_mapping = ",".join(f"{ids[j]}={branch[j]}" for j in range(num_meas))
+            lines.append(f"if {id_branch_mapping} => {self.processing_fn(*branch)}")
         return "\n".join(lines)
 
     def __repr__(self):
@@ -583,14 +681,49 @@ def get_mcm_predicates(conditions: tuple[MeasurementValue]) -> list[MeasurementV
     Returns:
         Sequence[MeasurementValue]: Updated sequence of mutually exclusive predicates.
     """
-    new_conds = [conditions[0]]
-    false_cond = ~conditions[0]
+    # Each predicate is built directly over the merged measurement list of the
+    # conditions it depends on, with a flat processing function. Chaining `&`/`~`
+    # instead would re-merge the growing measurement lists for every condition and
+    # stack O(K)-deep closures.
+    fns = tuple(c.processing_fn for c in conditions)
+
+    def _projections(merged, num_conds):
+        positions = {m: i for i, m in enumerate(merged)}
+        return tuple(
+            tuple(positions[m] for m in conditions[j].measurements) for j in range(num_conds)
+        )
+
+    def _make_predicate(sub_fns, projections, include_last):
+        # True iff all conditions except the last are false, and (when
+        # ``include_last`` is set) the last condition is true.
+        def predicate(*x):
+            if include_last:
+                value = sub_fns[-1](*(x[i] for i in projections[-1]))
+                rest = zip(sub_fns[:-1], projections[:-1])
+            else:
+                value = qml.math.logical_not(sub_fns[0](*(x[i] for i in projections[0])))
+                rest = zip(sub_fns[1:], projections[1:])
+            for fn, proj in rest:
+                value = qml.math.logical_and(
+                    value, qml.math.logical_not(fn(*(x[i] for i in proj)))
+                )
+            return value
+
+        return predicate
 
-    for c in conditions[1:]:
-        new_conds.append(false_cond & c)
-        false_cond = false_cond & ~c
+    new_conds = [conditions[0]]
+    seen = dict.fromkeys(conditions[0].measurements)
+    for idx, c in enumerate(conditions[1:], start=1):
+        seen.update(dict.fromkeys(c.measurements))
+        merged = sorted(seen, key=lambda m: m.id)
+        projections = _projections(merged, idx + 1)
+        new_conds.append(
+            MeasurementValue(merged, _make_predicate(fns[: idx + 1], projections, True))
+        )
 
-    new_conds.append(false_cond)
+    merged = sorted(seen, key=lambda m: m.id)
+    projections = _projections(merged, len(conditions))
+    new_conds.append(MeasurementValue(merged, _make_predicate(fns, projections, False)))
     return new_conds
 
 
@@ -600,15 +733,15 @@ def find_post_processed_mcms(circuit):
     This includes any mid-circuit measurement that is post-selected or the object of a terminal
     measurement.
     """
-    post_processed_mcms = set(
+    post_processed_mcms = {
         op
         for op in circuit.operations
         if isinstance(op, MidMeasureMP) and op.postselect is not None
-    )
+    }
     for m in circuit.measurements:
         if isinstance(m.mv, list):
             for mv in m.mv:
-                post_processed_mcms = post_processed_mcms | set(mv.measurements)
+                post_processed_mcms.update(mv.measurements)
         elif m.mv is not None:
-            post_processed_mcms = post_processed_mcms | set(m.mv.measurements)
+            post_processed_mcms.update(m.mv.measurements)
     return post_processed_mcms
@@ -386,6 +386,15 @@ class TestMeasurementValueManipulation:
         assert branches[(1, 0)] is False
         assert branches[(1, 1)] is True
 
+    def test_branches_vectorized(self):
+        """Test that branches_vectorized evaluates all branches in one call and
+        matches the branches dictionary."""
+        m1 = MeasurementValue([mp1], lambda v: v)
+        m2 = MeasurementValue([mp2], lambda v: v)
+        combined = 2 * m1 + m2
+        values = combined.branches_vectorized()
+        assert qml.math.allclose(values, list(combined.branches.values()))
+
     def test_str(self):
         """Test that the output of the __str__ dunder method is as expected"""
         m = MeasurementValue([mp1], lambda v: v)